@@ -44,6 +44,8 @@ class Point(Generic[T1, T2]):
     xcoord: T1
     ycoord: T2
 
+    __slots__ = ("xcoord", "ycoord")
+
     def __init__(self, xcoord: T1, ycoord: T2) -> None:
         """
         The function initializes an object with x and y coordinates.
@@ -175,6 +177,25 @@ class Point(Generic[T1, T2]):
         """
         return (self.xcoord, self.ycoord) == (other.xcoord, other.ycoord)
 
+    def __hash__(self) -> int:
+        """
+        The `__hash__` function hashes a point by its coordinate tuple, consistent with `__eq__`, so
+        that points can be used in sets and as dictionary keys.
+
+        :return: The `__hash__` method returns the hash of the tuple `(xcoord, ycoord)`.
+
+        Examples:
+            >>> a = Point(3, 4)
+            >>> hash(a) == hash(Point(3, 4))
+            True
+            >>> len({a, Point(3, 4), Point(5, 6)})
+            2
+            >>> a3d = Point(a, 5)  # Point in 3d
+            >>> a3d in {Point(Point(3, 4), 5)}
+            True
+        """
+        return hash((self.xcoord, self.ycoord))
+
     def __iadd__(self, rhs: Vector2) -> "Point[T1, T2]":
         """
         The `__iadd__` method allows for in-place addition of a `Vector2` object to a `Point` object.
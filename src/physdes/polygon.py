@@ -16,6 +16,8 @@ One of the key functions in this module is point_in_polygon, which determines wh
 
 The point_in_polygon function uses a clever algorithm called the ray-casting algorithm. It works by imagining a horizontal line (ray) extending from the point to the right. It then counts how many times this line intersects with the edges of the polygon. If the number of intersections is odd, the point is inside the polygon; if it's even, the point is outside.
 
+For convex polygons, point_in_convex_polygon offers a cheaper alternative: it checks that the point lies on the same side of every edge and stops at the first edge that disagrees.
+
 Throughout the code, there are several important data transformations happening. For example, when creating a Polygon, the input points are converted into vectors relative to the first point (the origin). This makes it easier to perform calculations and transformations on the polygon.
 
 The module uses generic types (T) for coordinates, allowing it to work with both integer and floating-point coordinates. This flexibility makes the code more versatile and reusable in different contexts.
@@ -520,19 +522,73 @@ def point_in_polygon(pointset: PointSet, ptq: Point[T, T]) -> bool:
         >>> pointset = [Point(xcoord, ycoord) for xcoord, ycoord in coords]
         >>> point_in_polygon(pointset, Point(0, 1))
         True
+        >>> point_in_polygon(pointset, Point(4, 3))
+        False
     """
+    # Bind the coordinates to locals once: this loop is the hot path, and
+    # going through `displace()`/`cross()` would allocate two Vector2 per edge.
+    xq, yq = ptq.xcoord, ptq.ycoord
     res = False
     pt0 = pointset[-1]
+    x0, y0 = pt0.xcoord, pt0.ycoord
     for pt1 in pointset:
-        if (pt1.ycoord <= ptq.ycoord < pt0.ycoord) or (
-            pt0.ycoord <= ptq.ycoord < pt1.ycoord
-        ):
-            det = ptq.displace(pt0).cross(pt1.displace(pt0))
-            if pt1.ycoord > pt0.ycoord:
-                if det < 0:
-                    res = not res
-            else:  # v1.ycoord < v0.ycoord
-                if det > 0:
-                    res = not res
-        pt0 = pt1
+        x1, y1 = pt1.xcoord, pt1.ycoord
+        if (y1 <= yq < y0) or (y0 <= yq < y1):
+            det = (xq - x0) * (y1 - y0) - (x1 - x0) * (yq - y0)
+            # crossing iff det < 0 for an upward edge, det > 0 for a downward one
+            if det != 0 and (det < 0) == (y1 > y0):
+                res = not res
+        x0, y0 = x1, y1
     return res
+
+
+def point_in_convex_polygon(pointset: PointSet, ptq: Point[T, T]) -> bool:
+    """
+    The function `point_in_convex_polygon` determines if a given point is strictly inside a convex polygon.
+
+    Instead of counting ray crossings, it checks that the point lies on the same side of every edge
+    (half-plane test), and returns as soon as two edges disagree. The vertices may be given in either
+    clockwise or anticlockwise order, but must not contain repeated points. Points on the boundary are
+    reported as outside.
+
+    :param pointset: The `pointset` parameter is a list of points that define the vertices of a convex
+        polygon. Each point in the list is an instance of the `Point` class
+
+    :type pointset: PointSet
+
+    :param ptq: ptq is a Point object representing the point to be checked if it is within the polygon
+
+    :type ptq: Point[T, T]
+
+    :return: a boolean value indicating whether the given point `ptq` is strictly inside the convex
+        polygon defined by the `pointset`.
+
+    Examples:
+        >>> coords = [(0, -4), (5, 1), (1, 4), (-5, 1)]
+        >>> pointset = [Point(xcoord, ycoord) for xcoord, ycoord in coords]
+        >>> point_in_convex_polygon(pointset, Point(0, 1))
+        True
+        >>> point_in_convex_polygon(pointset[::-1], Point(0, 1))
+        True
+        >>> point_in_convex_polygon(pointset, Point(4, 3))
+        False
+        >>> point_in_convex_polygon(pointset, Point(5, 1))
+        False
+    """
+    xq, yq = ptq.xcoord, ptq.ycoord
+    has_pos = has_neg = False
+    pt0 = pointset[-1]
+    x0, y0 = pt0.xcoord, pt0.ycoord
+    for pt1 in pointset:
+        x1, y1 = pt1.xcoord, pt1.ycoord
+        det = (x1 - x0) * (yq - y0) - (y1 - y0) * (xq - x0)
+        if det > 0:
+            has_pos = True
+        elif det < 0:
+            has_neg = True
+        else:  # on the supporting line of an edge
+            return False
+        if has_pos and has_neg:
+            return False
+        x0, y0 = x1, y1
+    return True
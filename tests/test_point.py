@@ -12,6 +12,15 @@ def test_point():
     assert b != a
 
 
+def test_hash():
+    a = Point(4, 8)
+    b = Point(5, 6)
+    S = {a, b, Point(4, 8)}
+    assert len(S) == 2
+    assert Point(5, 6) in S
+    assert Point(6, 5) not in S
+
+
 def test_point2():
     a = Point(3, 4)
     r = Point(Interval(3, 4), Interval(5, 6))  # Rectangle
@@ -6,6 +6,7 @@ from physdes.polygon import (
     create_test_polygon,
     create_xmono_polygon,
     create_ymono_polygon,
+    point_in_convex_polygon,
     point_in_polygon,
 )
 from physdes.vector2 import Vector2
@@ -128,6 +129,20 @@ def test_polygon4():
     assert point_in_polygon(S, Point(qx, qy))
 
 
+def test_point_in_convex_polygon():
+    coords = [(0, -4), (3, -3), (5, 1), (3, 3), (1, 4), (-5, 1), (-6, -2), (-3, -4)]
+    S = [Point(xcoord, ycoord) for xcoord, ycoord in coords]
+    for qx in range(-7, 7):
+        for qy in range(-5, 6):
+            q = Point(qx, qy)
+            if point_in_convex_polygon(S, q):
+                assert point_in_polygon(S, q)
+                assert point_in_convex_polygon(S[::-1], q)
+    assert point_in_convex_polygon(S, Point(0, 0))
+    assert not point_in_convex_polygon(S, Point(6, 0))
+    assert not point_in_convex_polygon(S, Point(-5, 1))  # vertex
+
+
 # def test_polygon3():
 #     hgen = Halton([2, 3], [11, 7])
 #     coords = [hgen() for _ in range(40)]